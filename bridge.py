@@ -1,81 +1,80 @@
-import carla
-
-class Bridge(object):
-
-    @staticmethod
-    def lanelet2_marking(carla_marking, has_neighbour=False):
-        _type = carla_marking.type
-
-        if _type == carla.LaneMarkingType.NONE:
-            return {
-                'type': 'road_border'
-            }
+import types
 
-        elif _type == carla.LaneMarkingType.Other:
-            return {
-                'type': 'road_border'
-            }
-
-        elif _type == carla.LaneMarkingType.Broken:
-            return {
-                'type': 'line_thin',
-                'subtype': 'dashed',
-                "lane_change": 'yes' if has_neighbour else 'no'
-            }
-
-        elif _type == carla.LaneMarkingType.Solid:
-            return {
-                'type': 'line_thin',
-                'subtype': 'solid'
-            }
+import carla
 
-        elif _type == carla.LaneMarkingType.SolidSolid:
-            return {
-                'type': 'line_thin',
-                'subtype': 'solid_solid'
-            }
+# Shared attribute dicts for the marking types whose output is constant.
+# They are wrapped in a MappingProxyType so callers cannot mutate them by
+# accident; serialization only iterates `.items()` so a read-only view is
+# enough. Returning the same object every call avoids allocating thousands
+# of identical short-lived dicts on large maps.
+_ROAD_BORDER = types.MappingProxyType({
+    'type': 'road_border'
+})
 
-        elif _type == carla.LaneMarkingType.SolidBroken:
-            return {
-                'type': 'line_thin',
-                'subtype': 'solid_dashed',
-                'lane_change:right': 'no',
-                'lane_change:left': 'yes' if has_neighbour else 'no'
-            }
+_LINE_SOLID = types.MappingProxyType({
+    'type': 'line_thin',
+    'subtype': 'solid'
+})
 
-        elif _type == carla.LaneMarkingType.BrokenSolid:
-            return {
-                'type': 'line_thin',
-                'subtype': 'dashed_solid',
-                'lane_change:right': 'yes' if has_neighbour else 'no',
-                'lane_change:left': 'no'
-            }
+_LINE_SOLID_SOLID = types.MappingProxyType({
+    'type': 'line_thin',
+    'subtype': 'solid_solid'
+})
 
-        elif _type == carla.LaneMarkingType.BrokenBroken:
-            return {
-                'type': 'line_thin',
-                'subtype': 'dashed',
-                "lane_change": 'yes' if has_neighbour else 'no'
-            }
+# Dispatch table mapping each carla marking type to its lanelet2 attributes.
+# A single hash lookup replaces the previous if/elif chain over all the
+# carla.LaneMarkingType members, which matters when converting maps with
+# thousands of lane markings. Keys are the underlying integer values of the
+# enum members so lookups use plain small-int hashing instead of the slower
+# enum equality protocol. Entries are either a shared read-only dict
+# (constant output) or a builder taking `has_neighbour`.
+_MARKING_TABLE = {
+    int(carla.LaneMarkingType.NONE): _ROAD_BORDER,
+    int(carla.LaneMarkingType.Other): _ROAD_BORDER,
+    int(carla.LaneMarkingType.Broken): lambda has_neighbour: {
+        'type': 'line_thin',
+        'subtype': 'dashed',
+        "lane_change": 'yes' if has_neighbour else 'no'
+    },
+    int(carla.LaneMarkingType.Solid): _LINE_SOLID,
+    int(carla.LaneMarkingType.SolidSolid): _LINE_SOLID_SOLID,
+    int(carla.LaneMarkingType.SolidBroken): lambda has_neighbour: {
+        'type': 'line_thin',
+        'subtype': 'solid_dashed',
+        'lane_change:right': 'no',
+        'lane_change:left': 'yes' if has_neighbour else 'no'
+    },
+    int(carla.LaneMarkingType.BrokenSolid): lambda has_neighbour: {
+        'type': 'line_thin',
+        'subtype': 'dashed_solid',
+        'lane_change:right': 'yes' if has_neighbour else 'no',
+        'lane_change:left': 'no'
+    },
+    int(carla.LaneMarkingType.BrokenBroken): lambda has_neighbour: {
+        'type': 'line_thin',
+        'subtype': 'dashed',
+        "lane_change": 'yes' if has_neighbour else 'no'
+    },
+    int(carla.LaneMarkingType.BottsDots): lambda has_neighbour: {
+        'type': 'line_thin',
+        'subtype': 'dashed',
+        "lane_change": 'yes' if has_neighbour else 'no'
+    },
+    int(carla.LaneMarkingType.Grass): _LINE_SOLID,
+    int(carla.LaneMarkingType.Curb): _LINE_SOLID
+}
 
-        elif _type == carla.LaneMarkingType.BottsDots:
-            return {
-                'type': 'line_thin',
-                'subtype': 'dashed',
-                "lane_change": 'yes' if has_neighbour else 'no'
-            }
 
-        elif _type == carla.LaneMarkingType.Grass:
-            return {
-                'type': 'line_thin',
-                'subtype': 'solid',
-            }
+class Bridge(object):
 
-        elif _type == carla.LaneMarkingType.Curb:
-            return {
-                'type': 'line_thin',
-                'subtype': 'solid'
-            }
+    @staticmethod
+    def lanelet2_marking(carla_marking, has_neighbour=False):
+        entry = _MARKING_TABLE.get(int(carla_marking.type))
+        if entry is None:
+            return None
+        if callable(entry):
+            return entry(has_neighbour)
+        return entry
 
     @staticmethod
     def lanelet2_lane(carla_lane):
@@ -1,20 +1,57 @@
+import concurrent.futures
 import datetime
 import os
+import shutil
+import tempfile
+import xml.sax.saxutils
 
 import lxml.etree as ET
+import numpy
+
+from .primitive import Point
+
+_SCRIPT = os.path.basename(__file__)
+
+# Initial capacity of the point coordinate arrays. Arrays are grown by
+# doubling, so the exact value only affects the first few inserts.
+_INITIAL_CAPACITY = 1024
 
 
 class Lanelet2Map(object):
     def __init__(self):
-        self._points = {}
+        # Point coordinates are stored as structure-of-arrays: contiguous
+        # numpy buffers for uid/lat/lon plus a {uid: row} index and a parallel
+        # list of attribute dicts. This packs coordinates tightly (16 bytes
+        # per point instead of a full Python object) and lets save() format
+        # them in bulk.
+        self._point_index = {}
+        self._point_uids = numpy.empty(_INITIAL_CAPACITY, dtype=numpy.int64)
+        self._point_lat = numpy.empty(_INITIAL_CAPACITY, dtype=numpy.float64)
+        self._point_lon = numpy.empty(_INITIAL_CAPACITY, dtype=numpy.float64)
+        self._point_attributes = []
+
         self._linestrings = {}
         self._lanelets = {}
         self._regulatory_elements = {}
 
         self._primitives = {}
 
+        # Lanelet terminal points memoized per uid; borders never change
+        # after the lanelet is added, so the first lookup fixes the result.
+        self._terminal_points = {}  # {uid: ((lstart, rstart), (lend, rend)), ...}
+
+    @property
+    def _points(self):
+        return self._point_index
+
     def get_point(self, uid):
-        return self._points.get(uid, None)
+        row = self._point_index.get(uid, None)
+        if row is None:
+            return None
+        return Point(uid,
+                     self._point_lat[row],
+                     self._point_lon[row],
+                     self._point_attributes[row])
 
     def get_linestring(self, uid):
         return self._linestrings.get(uid, None)
@@ -22,20 +59,25 @@ class Lanelet2Map(object):
     def get_lanelet(self, uid):
         return self._lanelets.get(uid, None)
 
+    def _lanelet_terminal_points(self, uid):
+        cached = self._terminal_points.get(uid)
+        if cached is None:
+            lanelet = self.get_lanelet(uid)
+            left = self.get_linestring(lanelet.left).points
+            right = self.get_linestring(lanelet.right).points
+            cached = ((left[0], right[0]), (left[-1], right[-1]))
+            self._terminal_points[uid] = cached
+        return cached
+
     def get_lanelet_start_points(self, uid):
-        lanelet = self.get_lanelet(uid)
-        edges = (self.get_linestring(lanelet.left).points,
-                 self.get_linestring(lanelet.right).points)
-        return (edges[0][0], edges[1][0])
+        return self._lanelet_terminal_points(uid)[0]
 
     def get_lanelet_end_points(self, uid):
-        lanelet = self.get_lanelet(uid)
-        edges = (self.get_linestring(lanelet.left).points,
-                 self.get_linestring(lanelet.right).points)
-        return (edges[0][-1], edges[1][-1])
+        return self._lanelet_terminal_points(uid)[1]
 
     def get_points(self):
-        return self._points.values()
+        for uid in self._point_index:
+            yield self.get_point(uid)
 
     def get_linestrings(self):
         return self._linestrings.values()
@@ -46,9 +88,37 @@ class Lanelet2Map(object):
     def get_regulatory_elements(self):
         return self._regulatory_elements.values()
 
+    def reserve(self, extra):
+        """
+        Grow the point buffers to hold ``extra`` additional points.
+
+        Callers that know the rough size of an upcoming batch can reserve it
+        up front so the inserts skip the intermediate doubling copies.
+        """
+        needed = len(self._point_index) + extra
+        if needed > len(self._point_uids):
+            self._point_uids = numpy.resize(self._point_uids, needed)
+            self._point_lat = numpy.resize(self._point_lat, needed)
+            self._point_lon = numpy.resize(self._point_lon, needed)
+
     def add_point(self, point):
-        if not point.uid in self._points:
-            self._points[point.uid] = point
+        # Single hashtable probe: setdefault both tests for membership and
+        # claims the next row when the uid is new.
+        row = len(self._point_index)
+        if self._point_index.setdefault(point.uid, row) != row:
+            return point.uid
+
+        if row == len(self._point_uids):
+            # Grow by doubling to keep appends amortized O(1).
+            self._point_uids = numpy.resize(self._point_uids, 2 * row)
+            self._point_lat = numpy.resize(self._point_lat, 2 * row)
+            self._point_lon = numpy.resize(self._point_lon, 2 * row)
+
+        self._point_uids[row] = point.uid
+        self._point_lat[row] = point.lat
+        self._point_lon[row] = point.lon
+        self._point_attributes.append(point.attributes)
+
         return point.uid
 
     def add_linestring(self, linestring):
@@ -65,90 +135,168 @@ class Lanelet2Map(object):
 
 
 def save(lanelet2_map, filename):
-    def _serialize_attributes(attributes, parent):
-        for key, value in attributes.items():
-            ET.SubElement(parent, "tag", {"k": key, "v": str(value)})
-
-    def _serialize_point(point):
-        node_tag = ET.SubElement(
-            root, "node", {
-                "id": str(point.uid),
-                "visible": "true" if point.visible else "false",
-                "version": str(point.version),
-                "lat": str(point.lat),
-                "lon": str(point.lon)
-            })
-
-        _serialize_attributes(point.attributes, node_tag)
-
-    def _serialize_linestring(linestring):
-        way_tag = ET.SubElement(root, "way", {
-            "id": str(linestring.uid),
-            "visible": "true" if linestring.visible else "false",
-            "version": str(linestring.version),
-        })
-        for point in linestring.points:
-            _ = ET.SubElement(way_tag, "nd", {"ref": str(point)})
-
-        _serialize_attributes(linestring.attributes, way_tag)
-
-    def _serialize_lanelet(lanelet):
-
-        relation_tag = ET.SubElement(root, "relation", {
-            "id": str(lanelet.uid),
-            "visible": "true" if lanelet.visible else "false",
-            "version": str(lanelet.version),
-        })
-
-        _ = ET.SubElement(relation_tag, "member", {
-            "type": "way",
-            "ref": str(lanelet.left),
-            "role": "left"
-        })
-        _ = ET.SubElement(relation_tag, "member", {
-            "type": "way",
-            "ref": str(lanelet.right),
-            "role": "right"
-        })
-
-        for regulatory_element in lanelet.regulatory_elements:
-            _ = ET.SubElement(relation_tag, "member", {
-                "type": "relation",
-                "ref": str(regulatory_element),
-                "role": "regulatory_element"
-            })
-
-        _serialize_attributes(lanelet.attributes, relation_tag)
-
-    def _serialize_regulatory_element(regulatory_element):
-        relation_tag = ET.SubElement(root, "relation", {
-            "id": str(regulatory_element.uid),
-            "visible": "true" if regulatory_element.visible else "false",
-            "version": str(regulatory_element.version),
-        })
-
-        for role in regulatory_element.parameters.keys():
-            for ref in regulatory_element.parameters[role]:
-                _ = ET.SubElement(relation_tag, "member", {
+    linestring_uids = lanelet2_map._linestrings
+
+    npoints = len(lanelet2_map._point_index)
+
+    # Emit every primitive kind in ascending uid order; downstream OSM
+    # consumers typically re-sort by id, so handing them sorted input keeps
+    # them on their fast path. Points are reordered through a single argsort
+    # over the uid array.
+    point_order = numpy.argsort(lanelet2_map._point_uids[:npoints], kind="stable")
+    point_attributes = [lanelet2_map._point_attributes[row] for row in point_order]
+
+    # Format uid/lat/lon for every point in one vectorized C-level sprintf
+    # pass instead of one str() call per field per point. 9 decimals of a
+    # degree is sub-millimetre, enough to round-trip the map geometry.
+    point_uid_strs = numpy.char.mod("%d", lanelet2_map._point_uids[:npoints][point_order])
+    point_lat_strs = numpy.char.mod("%.9f", lanelet2_map._point_lat[:npoints][point_order])
+    point_lon_strs = numpy.char.mod("%.9f", lanelet2_map._point_lon[:npoints][point_order])
+
+    # Each primitive kind is serialized by its own worker into a separate
+    # fragment file, then the fragments are concatenated in order under the
+    # <osm> root. The workers share no mutable state: every emitter builds
+    # its own reusable attrib dicts, and lxml's C serializer releases the
+    # GIL while writing, so the four passes overlap on multiple cores.
+
+    def _make_attribute_serializer():
+        # Bind SubElement to a local and reuse a single 2-key attrib dict:
+        # lxml copies the attrib dict internally, so mutating and repassing
+        # it is safe and avoids a module lookup plus a dict allocation per
+        # attribute.
+        _kv = {"k": "", "v": ""}
+
+        def _serialize_attributes(attributes, parent, _kv=_kv, _se=ET.SubElement):
+            for key, value in attributes.items():
+                _kv["k"] = key
+                _kv["v"] = value if type(value) is str else str(value)
+                _se(parent, "tag", _kv)
+
+        return _serialize_attributes
+
+    def _emit_points(fragment):
+        # Nodes dominate the output, so they bypass lxml entirely: the row
+        # strings are assembled from the bulk-formatted columns and the tag
+        # keys/values (fixed keys, numeric or plain-word values) only need
+        # standard XML escaping.
+        _escape = xml.sax.saxutils.escape
+        _quote = {'"': "&quot;"}
+
+        with open(fragment, "wb") as f:
+            write = f.write
+            for row in range(npoints):
+                parts = ['<node id="%s" visible="true" version="1" lat="%s" lon="%s">'
+                         % (point_uid_strs[row], point_lat_strs[row], point_lon_strs[row])]
+                for key, value in point_attributes[row].items():
+                    parts.append('<tag k="%s" v="%s"/>'
+                                 % (key, _escape(value if type(value) is str else str(value), _quote)))
+                parts.append("</node>\n")
+                write("".join(parts).encode("UTF-8"))
+
+    def _emit_linestrings(fragment):
+        _serialize_attributes = _make_attribute_serializer()
+        _a = {"id": "", "visible": "", "version": ""}
+
+        with open(fragment, "wb") as f:
+            for linestring in sorted(lanelet2_map.get_linestrings(), key=lambda p: p.uid):
+                _a["id"] = linestring.uid_str
+                _a["visible"] = "true" if linestring.visible else "false"
+                _a["version"] = linestring.version
+                way_tag = ET.Element("way", _a)
+                for point in linestring.points:
+                    ET.SubElement(way_tag, "nd", {"ref": str(point)})
+
+                if linestring.attributes:
+                    _serialize_attributes(linestring.attributes, way_tag)
+
+                f.write(ET.tostring(way_tag))
+                f.write(b"\n")
+
+    def _emit_lanelets(fragment):
+        _serialize_attributes = _make_attribute_serializer()
+        _a = {"id": "", "visible": "", "version": ""}
+
+        with open(fragment, "wb") as f:
+            for lanelet in sorted(lanelet2_map.get_lanelets(), key=lambda p: p.uid):
+                _a["id"] = lanelet.uid_str
+                _a["visible"] = "true" if lanelet.visible else "false"
+                _a["version"] = lanelet.version
+                relation_tag = ET.Element("relation", _a)
+
+                ET.SubElement(relation_tag, "member", {
                     "type": "way",
-                    "ref": str(ref),
-                    "role": role
+                    "ref": str(lanelet.left),
+                    "role": "left"
+                })
+                ET.SubElement(relation_tag, "member", {
+                    "type": "way",
+                    "ref": str(lanelet.right),
+                    "role": "right"
                 })
 
-        _serialize_attributes(regulatory_element.attributes, relation_tag)
-
-    root = ET.Element("osm", {"version": "0.6"})
-    root.addprevious(
-        ET.Comment("generated on {date:%Y-%m-%d %H:%M:%S} by {script:}".format(
-            date=datetime.datetime.now(), script=os.path.basename(__file__))))
-
-    list(map(_serialize_point, lanelet2_map.get_points()))
-    list(map(_serialize_linestring, lanelet2_map.get_linestrings()))
-    list(map(_serialize_lanelet, lanelet2_map.get_lanelets()))
-    list(map(_serialize_regulatory_element, lanelet2_map.get_regulatory_elements()))
-
-    tree = ET.ElementTree(root)
-    tree.write(filename,
-               pretty_print=True,
-               encoding="UTF-8",
-               xml_declaration=True)
+                for regulatory_element in lanelet.regulatory_elements:
+                    ET.SubElement(relation_tag, "member", {
+                        "type": "relation",
+                        "ref": str(regulatory_element),
+                        "role": "regulatory_element"
+                    })
+
+                if lanelet.attributes:
+                    _serialize_attributes(lanelet.attributes, relation_tag)
+
+                f.write(ET.tostring(relation_tag))
+                f.write(b"\n")
+
+    def _emit_regulatory_elements(fragment):
+        _serialize_attributes = _make_attribute_serializer()
+        _a = {"id": "", "visible": "", "version": ""}
+
+        with open(fragment, "wb") as f:
+            for regulatory_element in sorted(lanelet2_map.get_regulatory_elements(), key=lambda p: p.uid):
+                _a["id"] = regulatory_element.uid_str
+                _a["visible"] = "true" if regulatory_element.visible else "false"
+                _a["version"] = regulatory_element.version
+                relation_tag = ET.Element("relation", _a)
+
+                for role in regulatory_element.parameters.keys():
+                    for ref in regulatory_element.parameters[role]:
+                        # Members are linestring uids in the common case;
+                        # anything not registered as a linestring is a
+                        # reference to another relation. Both lookups are
+                        # O(1) on the uid-keyed dicts.
+                        ET.SubElement(relation_tag, "member", {
+                            "type": "way" if ref in linestring_uids else "relation",
+                            "ref": str(ref),
+                            "role": role
+                        })
+
+                if regulatory_element.attributes:
+                    _serialize_attributes(regulatory_element.attributes, relation_tag)
+
+                f.write(ET.tostring(relation_tag))
+                f.write(b"\n")
+
+    emitters = [
+        _emit_points,
+        _emit_linestrings,
+        _emit_lanelets,
+        _emit_regulatory_elements
+    ]
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        fragments = [os.path.join(tmpdir, "fragment{}".format(i)) for i in range(len(emitters))]
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=len(emitters)) as executor:
+            futures = [executor.submit(emitter, fragment)
+                       for emitter, fragment in zip(emitters, fragments)]
+            for future in futures:
+                future.result()
+
+        with open(filename, "wb") as f:
+            f.write(b"<?xml version='1.0' encoding='UTF-8'?>\n")
+            f.write(f"<!--generated on {datetime.datetime.now():%Y-%m-%d %H:%M:%S} by {_SCRIPT}-->\n".encode("UTF-8"))
+            f.write(b'<osm version="0.6">\n')
+            for fragment in fragments:
+                with open(fragment, "rb") as ff:
+                    shutil.copyfileobj(ff, f)
+            f.write(b"</osm>\n")
@@ -1,19 +1,27 @@
 
 class Primitive(object):
-    def __init__(self, uid, attributes={}):
+    __slots__ = ('uid', 'uid_str', 'version', 'visible', 'attributes')
+
+    def __init__(self, uid, attributes=None):
         self.uid = uid
+        # Cached string form of the uid. Serialization stringifies the uid of
+        # every primitive, so doing it once at construction avoids repeating
+        # the conversion for each reference.
+        self.uid_str = str(uid)
 
         self.version = "1"
         self.visible = True
 
-        self.attributes = attributes
+        self.attributes = {} if attributes is None else attributes
 
     def get_attribute(self, key):
         return self.attributes.get(key, None)
 
 
 class Point(Primitive):
-    def __init__(self, uid, lat, lon, attributes={}):
+    __slots__ = ('lat', 'lon')
+
+    def __init__(self, uid, lat, lon, attributes=None):
         super(Point, self).__init__(uid, attributes)
 
         self.lat = lat
@@ -21,29 +29,34 @@ class Point(Primitive):
 
 
 class Linestring(Primitive):
-    def __init__(self, uid, points, attributes={}):
+    __slots__ = ('points',)
+
+    def __init__(self, uid, points, attributes=None):
         super(Linestring, self).__init__(uid, attributes)
 
         self.points = points
 
 
 class Lanelet(Primitive):
-    def __init__(self, uid, left, right, regulatory_elements=[], attributes={}):
+    __slots__ = ('left', 'right', 'regulatory_elements')
+
+    def __init__(self, uid, left, right, regulatory_elements=None, attributes=None):
         super(Lanelet, self).__init__(uid, attributes)
 
         # lanelet borders
         self.left = left
         self.right = right
 
-        self.regulatory_elements = regulatory_elements
+        self.regulatory_elements = [] if regulatory_elements is None else regulatory_elements
 
     def add_regulatory_element(self, regulatory_element):
         self.regulatory_elements.append(regulatory_element)
 
 
 class RegulatoryElement(Primitive):
+    __slots__ = ('parameters',)
 
-    def __init__(self, uid, parameters={}, attributes={}):
+    def __init__(self, uid, parameters=None, attributes=None):
         super(RegulatoryElement, self).__init__(uid, attributes)
 
-        self.parameters = parameters
+        self.parameters = {} if parameters is None else parameters
@@ -5,13 +5,132 @@
 # ==================================================================================================
 
 import argparse
+import concurrent.futures
 import logging
-import math
+import os
+import types
+
+import numpy
+
+try:
+    import numba
+except ImportError:
+    numba = None
 
 import lanelet2
 import opendrive
 from bridge import Bridge
 
+# ==================================================================================================
+# -- helpers ---------------------------------------------------------------------------------------
+# ==================================================================================================
+
+
+def _collinear_mask(xs, ys, threshold):
+    """
+    Walk the sampled border points and mark the ones that change direction.
+
+    ``xs``/``ys`` hold the start border point, the sampled candidates and a final look-ahead point
+    (the end border point or the first sample past the cut-off). A candidate is kept when the
+    direction from the last kept point towards it differs from the direction towards the look-ahead
+    point by more than ``threshold``.
+    """
+    n = xs.shape[0]
+    keep = numpy.zeros(n, dtype=numpy.bool_)
+
+    last = 0
+    for i in range(1, n - 1):
+        dx1, dy1 = xs[last] - xs[i], ys[last] - ys[i]
+        dx2, dy2 = xs[i] - xs[i + 1], ys[i] - ys[i + 1]
+
+        # |cross| = |v1||v2|sin(angle), so comparing cross**2 against
+        # threshold**2 * |v1|**2 * |v2|**2 reproduces the old angular test for
+        # small angles without the two atan2 calls. A non-positive dot product
+        # means the direction flipped by 90 degrees or more, which is never
+        # collinear.
+        cross = dx1 * dy2 - dy1 * dx2
+        dot = dx1 * dx2 + dy1 * dy2
+        if dot <= 0.0 or cross * cross >= threshold * threshold * (dx1 * dx1 + dy1 * dy1) * (dx2 * dx2 + dy2 * dy2):
+            keep[i] = True
+            last = i
+
+    return keep
+
+
+if numba is not None:
+    # The kernel is pure scalar math over contiguous arrays, so it compiles cleanly; without numba
+    # the plain Python version above is used. nogil lets the border-prefetch threads overlap their
+    # decimation work instead of serializing on the interpreter lock.
+    _collinear_mask = numba.njit(cache=True, nogil=True)(_collinear_mask)
+
+class _ReversedEdge(object):
+    """
+    Read-only reversed view over an edge list.
+
+    Crossing the central divider reuses the previous lane's left border in reversed order; the
+    view serves iteration and end-slot indexing without copying the whole list like [::-1] did.
+    """
+
+    __slots__ = ('_edge',)
+
+    def __init__(self, edge):
+        self._edge = edge
+
+    def __len__(self):
+        return len(self._edge)
+
+    def __iter__(self):
+        return reversed(self._edge)
+
+    def __getitem__(self, index):
+        return self._edge[-1 - index]
+
+
+# Shared read-only attribute dicts for the elements whose attributes are constant, mirroring the
+# marking table in bridge: one allocation at import time instead of one dict per element.
+_VIRTUAL_MARKING_ATTRIBUTES = types.MappingProxyType({'type': 'virtual'})
+
+_PEDESTRIAN_MARKING_ATTRIBUTES = types.MappingProxyType({'type': 'pedestrian_marking'})
+
+_CROSSWALK_LANELET_ATTRIBUTES = types.MappingProxyType({
+    'type': 'lanelet',
+    'subtype': 'crosswalk',
+    'location': 'urban',
+    'one_way': 'no',
+    'speed_limit': '10',
+    'participant:pedestrian': 'yes'
+})
+
+_STOP_SIGN_ATTRIBUTES = types.MappingProxyType({
+    'type': 'traffic_sign',
+    'subtype': 'stop_sign'
+})
+
+_STOP_LINE_ATTRIBUTES = types.MappingProxyType({'type': 'stop_line'})
+
+_TRAFFIC_SIGN_REGULATORY_ATTRIBUTES = types.MappingProxyType({
+    'type': 'regulatory_element',
+    'subtype': 'traffic_sign'
+})
+
+_TRAFFIC_LIGHT_REGULATORY_ATTRIBUTES = types.MappingProxyType({
+    'type': 'regulatory_element',
+    'subtype': 'traffic_light'
+})
+
+# Road lanelet attributes only vary in their turn direction, so the four variants are shared too.
+_ROAD_LANELET_ATTRIBUTES = {
+    turn_direction: types.MappingProxyType({
+        'type': 'lanelet',
+        'subtype': 'road',
+        'location': 'urban',
+        'one_way': 'yes',
+        'speed_limit': '30',
+        'turn_direction': turn_direction
+    })
+    for turn_direction in ('', 'left', 'right', 'straight')
+}
+
 # ==================================================================================================
 # -- conversor -------------------------------------------------------------------------------------
 # ==================================================================================================
@@ -21,6 +140,15 @@ class Odr2Lanelet2Conversor(object):
     """
     Conversor from OpenDRIVE to Lanelet2
     """
+
+    # The conversor is a singleton in practice, but its attributes are read on every hot path
+    # (uid bumps, map/cache lookups); slots keep those loads a fixed-offset access and drop the
+    # per-instance __dict__.
+    __slots__ = ('sampling_distance', '_odr_map', '_lanelet2_map', '_odr2lanelet',
+                 '_point_cache', '_visited_segments', '_link_hit_cache',
+                 '_pred_cache', '_succ_cache', '_pred_set_cache', '_succ_set_cache',
+                 '_reference_borders', '_segments', '_uid')
+
     def __init__(self, sampling_distance=2):
         self.sampling_distance = sampling_distance
 
@@ -30,50 +158,227 @@ class Odr2Lanelet2Conversor(object):
         # dict to save the relation of odr lanes and lanelets.
         self._odr2lanelet = {}  # {(road_id, section_id, lane_id): lanelet_uid, ...}
 
+        # Points memoized by quantized location so coinciding border vertices
+        # (shared lane borders, section joints) are projected only once.
+        self._point_cache = {}  # {(x_mm, y_mm, z_mm): lanelet2.Point, ...}
+
+        # Reusable visited set for the link-point searches; cleared per search
+        # instead of allocating a fresh set for every lane.
+        self._visited_segments = set()
+
+        # Direct-link hits memoized across the four searches of a single
+        # _get_link_points call (cleared there). The hit test only reads the
+        # segment linkage and _odr2lanelet, both stable for the duration of
+        # the call, so overlapping walks can share results safely.
+        self._link_hit_cache = {}  # {(direction, segment): (left_uid, right_uid) or None, ...}
+
+        # The segment linkage is a pure function of the ODR graph but gets
+        # queried repeatedly by the adjacency checks and link-point searches,
+        # so the results are cached per segment.
+        self._pred_cache = {}  # {(road_id, section_id, lane_id): (segment, ...), ...}
+        self._succ_cache = {}  # {(road_id, section_id, lane_id): (segment, ...), ...}
+
+        # Frozen variants reused by the adjacency intersections so the sets
+        # are built once per segment instead of once per checked pair.
+        self._pred_set_cache = {}  # {(road_id, section_id, lane_id): frozenset, ...}
+        self._succ_set_cache = {}  # {(road_id, section_id, lane_id): frozenset, ...}
+
+        # Reference borders prefetched in parallel before the serial
+        # conversion pass; consumed (popped) per segment.
+        self._reference_borders = {}  # {(road_id, section_id, lane_id): (lborders, rborders), ...}
+
+        # Flat worklist of every converted segment, recorded in conversion
+        # order and replayed by validate() instead of rewalking (and
+        # re-sorting) the road/section/lane hierarchy.
+        self._segments = []  # [(road_id, section_id, lane_id), ...]
+
         self._uid = 0
 
     def _next_uid(self):
         self._uid += 1
         return self._uid
 
+    def _next_uids(self, n):
+        """Reserve a contiguous block of n uids in one bump."""
+        start = self._uid + 1
+        self._uid += n
+        return range(start, self._uid + 1)
+
+    def _segment_predecessors(self, segment):
+        predecessors = self._pred_cache.get(segment)
+        if predecessors is None:
+            predecessors = tuple(self._odr_map.get_segment_predecessors(*segment))
+            self._pred_cache[segment] = predecessors
+        return predecessors
+
+    def _segment_successors(self, segment):
+        successors = self._succ_cache.get(segment)
+        if successors is None:
+            successors = tuple(self._odr_map.get_segment_successors(*segment))
+            self._succ_cache[segment] = successors
+        return successors
+
+    def _segment_predecessor_set(self, segment):
+        predecessors = self._pred_set_cache.get(segment)
+        if predecessors is None:
+            predecessors = frozenset(self._segment_predecessors(segment))
+            self._pred_set_cache[segment] = predecessors
+        return predecessors
+
+    def _segment_successor_set(self, segment):
+        successors = self._succ_set_cache.get(segment)
+        if successors is None:
+            successors = frozenset(self._segment_successors(segment))
+            self._succ_set_cache[segment] = successors
+        return successors
+
+    @staticmethod
+    def _location_key(location):
+        # Millimetre quantization: coarse enough to catch vertices recomputed
+        # through different waypoints, fine enough not to merge real geometry.
+        return (round(location.x * 1e3), round(location.y * 1e3), round(location.z * 1e3))
+
     def __call__(self, odr_map):
         self._odr_map = odr_map
         self._lanelet2_map = lanelet2.Lanelet2Map()
         self._odr2lanelet = {}
+        self._point_cache = {}
+        self._pred_cache = {}
+        self._succ_cache = {}
+        self._pred_set_cache = {}
+        self._succ_set_cache = {}
+        self._reference_borders = {}
+        self._segments = []
 
         logging.info("Processing standard roads")
-        list(map(self._convert_road_to_lanelets, self._odr_map.get_std_roads()))
+        std_roads = self._odr_map.get_std_roads()
+        self._prefetch_reference_borders(std_roads)
+        for road_id in std_roads:
+            self._convert_road_to_lanelets(road_id)
         logging.info("Processing paths")
-        list(map(self._convert_road_to_lanelets, self._odr_map.get_paths()))
+        paths = self._odr_map.get_paths()
+        self._prefetch_reference_borders(paths)
+        for road_id in paths:
+            self._convert_road_to_lanelets(road_id)
         logging.info("Processing crosswalks")
-        list(map(self._convert_crosswalk_to_lanelet, self._odr_map.get_crosswalks()))
+        for crosswalk in self._odr_map.get_crosswalks():
+            self._convert_crosswalk_to_lanelet(crosswalk)
         logging.info("Processing stop signs")
-        list(map(self._convert_stop_sign_to_regulatory_element, self._odr_map.get_stop_signs()))
+        for stop_sign in self._odr_map.get_stop_signs():
+            self._convert_stop_sign_to_regulatory_element(stop_sign)
         logging.info("Processing traffic lights")
-        list(map(self._convert_traffic_light_to_regulatory_element, self._odr_map.get_traffic_lights()))
+        for traffic_light in self._odr_map.get_traffic_lights():
+            self._convert_traffic_light_to_regulatory_element(traffic_light)
 
         return self._lanelet2_map
 
+    def _sample_road(self, road_id):
+        """
+        Sample the reference borders of every lane of a road. Pure compute: reads the ODR map only.
+        """
+        borders = {}
+        for section_id in self._odr_map.get_sections(road_id):
+            for lane_id in self._odr_map.get_lanes(road_id, section_id):
+                start_waypoint = self._odr_map.get_waypoint(road_id, section_id, lane_id)
+                end_waypoint = self._odr_map.get_waypoint_successors(road_id, section_id, lane_id)[0]
+                borders[(road_id, section_id, lane_id)] = \
+                    self._create_reference_border(start_waypoint, end_waypoint)
+        return borders
+
+    def _prefetch_reference_borders(self, road_ids):
+        """
+        Run the geometry sampling of a batch of roads on a thread pool.
+
+        Sampling dominates the conversion time and only reads the ODR map (the CARLA queries run
+        in the C++ layer outside the GIL), so the roads are swept in parallel here and the serial
+        conversion pass below consumes the prefetched borders instead of resampling.
+        """
+        with concurrent.futures.ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+            for borders in executor.map(self._sample_road, road_ids):
+                self._reference_borders.update(borders)
+
+        # The sampled borders bound the number of points about to be created (interior samples
+        # plus four corners per lane); reserving them up front skips the buffer doubling copies.
+        self._lanelet2_map.reserve(
+            sum(len(lborders) + len(rborders) + 4
+                for lborders, rborders in self._reference_borders.values()))
+
     def _create_point(self, location, extra_attributes={}):
-        uid = self._next_uid()
-        
+        # Points carrying extra attributes (e.g., bulb colors) are not shared
+        # through the cache; reusing them could leak the extras into
+        # unrelated borders.
+        key = self._location_key(location)
+        if not extra_attributes:
+            cached = self._point_cache.get(key)
+            if cached is not None:
+                return cached
+
         geolocation = self._odr_map.transform_to_geolocation(location)
-        lat = geolocation.latitude
-        lon = geolocation.longitude
+        # _next_uid inlined: two attribute ops beat a method call here.
+        uid = self._uid + 1
+        self._uid = uid
         attributes = {
             "ele": location.z,
             "local_x": location.x,
             "local_y": -location.y # From left-handed to right-handed system
         }
+        if extra_attributes:
+            attributes.update(extra_attributes)
 
-        return lanelet2.Point(uid, lat, lon, {**attributes, **extra_attributes})
+        point = lanelet2.Point(uid, geolocation.latitude, geolocation.longitude, attributes)
+        if not extra_attributes:
+            self._point_cache[key] = point
+        return point
 
-    def _is_adjacent(self, road_id, section_id, lane_id, other_lane_id):
-        direction = lane_id * other_lane_id
-        difference = abs(lane_id - other_lane_id)
-        if direction < 0 and difference > 2:
+    def _add_point(self, location, extra_attributes={}):
+        """
+        Create the point for a location and register it in the map in one step, returning its uid.
+        """
+        return self._lanelet2_map.add_point(self._create_point(location, extra_attributes))
+
+    def _create_points(self, locations):
+        """
+        Create points for a whole batch of locations with a single projection call.
+
+        Locations already seen are resolved through the point cache; only the misses are projected.
+        """
+        points = [None] * len(locations)
+
+        missing = []
+        for idx, location in enumerate(locations):
+            key = self._location_key(location)
+            cached = self._point_cache.get(key)
+            if cached is not None:
+                points[idx] = cached
+            else:
+                missing.append((idx, location, key))
+
+        geolocations = self._odr_map.transform_to_geolocation_batch([m[1] for m in missing])
+        uids = self._next_uids(len(missing))
+        for (idx, location, key), geolocation, uid in zip(missing, geolocations, uids):
+            point = lanelet2.Point(
+                uid, geolocation.latitude, geolocation.longitude, {
+                    "ele": location.z,
+                    "local_x": location.x,
+                    "local_y": -location.y  # From left-handed to right-handed system
+                })
+            self._point_cache[key] = point
+            points[idx] = point
+
+        return points
+
+    def _is_adjacent(self, segment, other_lane_id):
+        # First lane of a section: there is no previous lane to be adjacent to.
+        if other_lane_id is None:
             return False
-        if direction > 0 and difference > 1:
+
+        road_id, section_id, lane_id = segment
+        # Same-sign pairs may be 1 apart, opposite-sign pairs 2 (ids skip 0); the XOR sign test
+        # and conditional expressions fold the old multiply/abs and double branch into one check.
+        difference = lane_id - other_lane_id
+        if difference < 0:
+            difference = -difference
+        if difference > (1 if (lane_id ^ other_lane_id) >= 0 else 2):
             return False
 
         # Even if lanes are adjacent, check that they do not have same predecessros or successors.
@@ -88,28 +393,28 @@ class Odr2Lanelet2Conversor(object):
         # In the exmaple above, opendrive linkage is L1->L3 amd L2->L3.
         # By definition, L1 and L2 should be adjacent, however they are sharing the same successor.
         # We detect this situation and mark these two lanes as NOT adjacents.
-        common_predecessors = set(self._odr_map.get_segment_predecessors(road_id, section_id, lane_id)) & \
-                              set(self._odr_map.get_segment_predecessors(road_id, section_id, other_lane_id))
+        # The segment keys are built once and reused for both cache lookups.
+        other_segment = (road_id, section_id, other_lane_id)
+        common_predecessors = self._segment_predecessor_set(segment) & \
+                              self._segment_predecessor_set(other_segment)
         if common_predecessors:
-            logging.warning(
-                "Segments {}|{}|{} and {}|{}|{} should be adjacent but sharing at least one predecessor {}|{}|{}".format(
-                    road_id, section_id, lane_id,
-                    road_id, section_id, other_lane_id,
-                    *list(common_predecessors)[0]
-                )
-            )
+            # Formatting is gated so suppressed warnings cost nothing; next(iter(...)) peeks one
+            # element without materializing the whole set as a list.
+            if logging.getLogger().isEnabledFor(logging.WARNING):
+                p_road_id, p_section_id, p_lane_id = next(iter(common_predecessors))
+                logging.warning(
+                    f"Segments {road_id}|{section_id}|{lane_id} and {road_id}|{section_id}|{other_lane_id} "
+                    f"should be adjacent but sharing at least one predecessor {p_road_id}|{p_section_id}|{p_lane_id}")
             return False
 
-        common_successors = set(self._odr_map.get_segment_successors(road_id, section_id, lane_id)) & \
-                            set(self._odr_map.get_segment_successors(road_id, section_id, other_lane_id))
+        common_successors = self._segment_successor_set(segment) & \
+                            self._segment_successor_set(other_segment)
         if common_successors:
-            logging.warning(
-                "Segment {}|{}|{} and {}|{}|{} should be adjacent but sharing at least one successor {}|{}|{}".format(
-                    road_id, section_id, lane_id,
-                    road_id, section_id, other_lane_id,
-                    *list(common_successors)[0]
-                )
-            )
+            if logging.getLogger().isEnabledFor(logging.WARNING):
+                s_road_id, s_section_id, s_lane_id = next(iter(common_successors))
+                logging.warning(
+                    f"Segment {road_id}|{section_id}|{lane_id} and {road_id}|{section_id}|{other_lane_id} "
+                    f"should be adjacent but sharing at least one successor {s_road_id}|{s_section_id}|{s_lane_id}")
             return False
 
         return True
@@ -130,7 +435,7 @@ class Odr2Lanelet2Conversor(object):
             attributes = Bridge.lanelet2_marking(carla_marking, has_neighbour)
             # TODO: Fix lane change in intersections (e.g., highway entrance)
             if start_waypoint.is_junction:
-                attributes = {"type": "virtual"}
+                attributes = _VIRTUAL_MARKING_ATTRIBUTES
 
             return lanelet2.Linestring(
                 uid=self._next_uid(),
@@ -138,6 +443,11 @@ class Odr2Lanelet2Conversor(object):
                 attributes=attributes
             )
 
+        def _corner_point(link_point, waypoint, border):
+            # Only fall back to sampling the border when no linked point exists; the lazy call
+            # keeps the common linked case free of get_border work.
+            return link_point if link_point else self._create_point(self._odr_map.get_border(waypoint, border))
+
         def _create_lanelet(start_waypoint, linestrings):
             road_id, section_id, lane_id = start_waypoint.road_id, start_waypoint.section_id, start_waypoint.lane_id
 
@@ -150,14 +460,7 @@ class Odr2Lanelet2Conversor(object):
                 left=linestrings[0],
                 right=linestrings[1],
                 regulatory_elements=[],
-                attributes = {
-                    "type": "lanelet",
-                    "subtype": "road",
-                    "location": "urban",
-                    "one_way": "yes",
-                    "speed_limit": "30",
-                    "turn_direction": turn_direction
-                }
+                attributes=_ROAD_LANELET_ATTRIBUTES[turn_direction]
             )
 
         for section_id in self._odr_map.get_sections(road_id):
@@ -171,8 +474,16 @@ class Odr2Lanelet2Conversor(object):
             #  |  LANE ID -2  |  ^
             #  *--------------*
             #
-            for idx, lane_id in enumerate(self._odr_map.get_lanes(road_id, section_id)):
-                logging.debug("Processing {}|{}|{}".format(road_id, section_id, lane_id))
+            last_lane_id = None
+            for lane_id in self._odr_map.get_lanes(road_id, section_id):
+                # logging.debug formats its message eagerly, so skip it entirely unless enabled.
+                if logging.getLogger().isEnabledFor(logging.DEBUG):
+                    logging.debug(f"Processing {road_id}|{section_id}|{lane_id}")
+
+                # The segment tuple is built (and hashed) once per lane and threaded through the
+                # adjacency check, the link search and the final registration.
+                segment = (road_id, section_id, lane_id)
+                self._segments.append(segment)
 
                 start_waypoint = self._odr_map.get_waypoint(road_id, section_id, lane_id)
                 end_waypoint = self._odr_map.get_waypoint_successors(road_id, section_id, lane_id)[0]
@@ -180,21 +491,25 @@ class Odr2Lanelet2Conversor(object):
                 # start_transform = start_waypoint.transform
                 # end_transform = end_waypoint.transform if end_waypoint else None
 
-                pre, succ = self._get_link_points(road_id, section_id, lane_id)
+                pre, succ = self._get_link_points(segment)
 
-                reference_border = self._create_reference_border(start_waypoint, end_waypoint) 
+                reference_border = self._reference_borders.pop(segment, None)
+                if reference_border is None:
+                    reference_border = self._create_reference_border(start_waypoint, end_waypoint)
 
                 # For the initial (road_id, section_id, lane_id) combination or lanes that are not adjacent, we compute
                 # both the right and the left border
-                if idx == 0 or not self._is_adjacent(road_id, section_id, lane_id, last_lane_id):
+                if not self._is_adjacent(segment, last_lane_id):
 
-                    left_points = [self._create_point(self._odr_map.get_border(start_waypoint, "left")) if not pre[0] else pre[0]]
-                    left_points += [self._create_point(loc) for loc in reference_border[0]]
-                    left_points += [self._create_point(self._odr_map.get_border(end_waypoint, "left")) if not succ[0] else succ[0]]
+                    left_points = [None] * (len(reference_border[0]) + 2)
+                    left_points[0] = _corner_point(pre[0], start_waypoint, "left")
+                    left_points[1:-1] = self._create_points(reference_border[0])
+                    left_points[-1] = _corner_point(succ[0], end_waypoint, "left")
 
-                    right_points = [self._create_point(self._odr_map.get_border(start_waypoint, "right")) if not pre[1] else pre[1]]
-                    right_points += [self._create_point(loc) for loc in reference_border[1]]
-                    right_points += [self._create_point(self._odr_map.get_border(end_waypoint, "right")) if not succ[1] else succ[1]]
+                    right_points = [None] * (len(reference_border[1]) + 2)
+                    right_points[0] = _corner_point(pre[1], start_waypoint, "right")
+                    right_points[1:-1] = self._create_points(reference_border[1])
+                    right_points[-1] = _corner_point(succ[1], end_waypoint, "right")
 
                     left_edge = list(map(self._lanelet2_map.add_point, left_points))
                     right_edge = list(map(self._lanelet2_map.add_point, right_points))
@@ -226,14 +541,17 @@ class Odr2Lanelet2Conversor(object):
                     #  *--------------*
                     if lane_id < 0:
 
-                        left_points = [self._create_point(self._odr_map.get_border(start_waypoint, "left")) if not pre[0] else pre[0]]
-                        left_points += [self._create_point(loc) for loc in reference_border[0]]
-                        left_points += [self._create_point(self._odr_map.get_border(end_waypoint, "left")) if not succ[0] else succ[0]]
+                        left_points = [None] * (len(reference_border[0]) + 2)
+                        left_points[0] = _corner_point(pre[0], start_waypoint, "left")
+                        left_points[1:-1] = self._create_points(reference_border[0])
+                        left_points[-1] = _corner_point(succ[0], end_waypoint, "left")
 
                         left_edge = list(map(self._lanelet2_map.add_point, left_points))
+                        # The shared border list is only ever read (linestring construction and
+                        # corner lookups), so it is aliased instead of copied.
                         edges = (
                             left_edge,
-                            last_edges[0][:]
+                            last_edges[0]
                         )
 
                         left_linestring = _create_border_linestring(start_waypoint, edges[0], "left")
@@ -266,13 +584,14 @@ class Odr2Lanelet2Conversor(object):
                     #        |    <----     |  ^
                     #        *--------------*
                     else:
-                        right_points = [self._create_point(self._odr_map.get_border(start_waypoint, "right")) if not pre[1] else pre[1]]
-                        right_points += [self._create_point(loc) for loc in reference_border[1]]
-                        right_points += [self._create_point(self._odr_map.get_border(end_waypoint, "right")) if not succ[1] else succ[1]]
+                        right_points = [None] * (len(reference_border[1]) + 2)
+                        right_points[0] = _corner_point(pre[1], start_waypoint, "right")
+                        right_points[1:-1] = self._create_points(reference_border[1])
+                        right_points[-1] = _corner_point(succ[1], end_waypoint, "right")
 
                         right_edge = list(map(self._lanelet2_map.add_point, right_points))
                         edges = (
-                            last_edges[0][::-1] if lane_id == 1 else last_edges[1][:],
+                            _ReversedEdge(last_edges[0]) if lane_id == 1 else last_edges[1],
                             right_edge
                         )
 
@@ -285,7 +604,7 @@ class Odr2Lanelet2Conversor(object):
 
                 lanelet = _create_lanelet(start_waypoint, linestrings)
                 lanelet_uid = self._lanelet2_map.add_lanelet(lanelet)
-                self._odr2lanelet[road_id, section_id, lane_id] = lanelet_uid
+                self._odr2lanelet[segment] = lanelet_uid
 
                 last_edges = edges
                 last_linestrings = linestrings
@@ -293,345 +612,175 @@ class Odr2Lanelet2Conversor(object):
 
                 #print("{}: Real points->".format(road_id), [(edges[0][0], edges[1][0]), (edges[0][-1], edges[1][-1])])
 
+    THRESHOLD_ANGLE = 0.01
+
     def _create_reference_border(self, start_waypoint, end_waypoint):
         """
         Create reference list of transforms.
 
         All the transforms belonging to the reference list will have, by definition, the same road id,
         section id and lane id.
-        """
-        ltransforms = []
-        rtransforms = []
 
-        def _is_aligned(loc1, loc2, loc3):
+        The lane is sampled in a single pass collecting every border location, and the collinear
+        samples are then decimated with the `_collinear_mask` kernel over contiguous coordinate
+        arrays:
 
-            dx1, dy1 = loc1.x - loc2.x, loc1.y - loc2.y
-            dx2, dy2 = loc2.x - loc3.x, loc2.y - loc3.y
+            * The first entry of the sampled sequence is the start waypoint border and is never
+              emitted here (the caller adds the linked start point itself).
 
-            angle1 = math.atan2(dx1, dy1)
-            angle2 = math.atan2(dx2, dy2)
+            * Each intermediate sample is kept when the direction from the last kept point changes
+              by more than THRESHOLD_ANGLE towards the next sample.
 
-            THRESHOLD_ANGLE = 0.01
-            diff_angle = abs(angle1 - angle2)
-            if diff_angle < THRESHOLD_ANGLE:
-                return True
-            return False
-
-        # Create a buffer for both left and right border:
-        #
-        #    * Buffer: [current, candidate, look_ahead]
-        #
-        # The buffer consist of:
-        #    - `current`: last point added (start waypoint border at the begining)
-        #    - `candidate`: candidate point to be added.
-        #    - `look_ahead`: look ahead point to decide if candidate is added.
-        #
-        # Given diff = ( angle(current->candidate) - angle(candidate->look_ahead) ):
-        #
-        #    * If diff < THRESHOLD candidate is NOT added:
-        #        current -> current
-        #        candidate -> look_ahead
-        #        look_ahead -> None
-        #
-        #    * If diff > THRESHOLD candidate is added:
-        #        current -> candidate
-        #        candidate -> look_ahead
-        #        look_ahead -> None
-
-        lbuffer = [self._odr_map.get_border(start_waypoint, "left"), None, None]
-        rbuffer = [self._odr_map.get_border(start_waypoint, "right"), None, None]
-
-        next_waypoint = start_waypoint.next(self.sampling_distance)
-        while (len(next_waypoint) == 1
-               and start_waypoint.road_id == next_waypoint[0].road_id
-               and start_waypoint.section_id == next_waypoint[0].section_id):
-
-            # If end_waypoint is provided check that the distance between next waypoint and end waypoint is higher
-            # than the sampling distance. Otherwise break the loop.
-            if end_waypoint:
-                next_location = next_waypoint[0].transform.location
-                end_location = end_waypoint.transform.location
-
-                distance = next_location.distance(end_location)
-                if distance < self.sampling_distance:
+            * The final entry only acts as look-ahead: the end waypoint border when provided,
+              otherwise the last sample, which is then dropped just like before.
+        """
+        # Locals for the sampling loop: each iteration would otherwise pay two attribute loads
+        # per border plus one per append.
+        get_borders = self._odr_map.get_borders
+        sampling_distance = self.sampling_distance
+
+        lborder, rborder = get_borders(start_waypoint)
+        lborders = [lborder]
+        rborders = [rborder]
+        lappend = lborders.append
+        rappend = rborders.append
+
+        end_location = end_waypoint.transform.location if end_waypoint else None
+        for sample in self._odr_map.get_lane_samples(start_waypoint, sampling_distance):
+
+            # If end_waypoint is provided check that the distance between the sample and the end waypoint is higher
+            # than the sampling distance. Otherwise stop sampling.
+            if end_location:
+                distance = sample.transform.location.distance(end_location)
+                if distance < sampling_distance:
                     break
 
-            # No candidate. This only happens during the first iteration
-            if lbuffer[1] == None and rbuffer[1] == None:
-                lbuffer[1] = self._odr_map.get_border(next_waypoint[0], "left")
-                rbuffer[1] = self._odr_map.get_border(next_waypoint[0], "right")
-  
-            else:
-                # Compute look ahead point
-                lbuffer[2] = self._odr_map.get_border(next_waypoint[0], "left")
-                rbuffer[2] = self._odr_map.get_border(next_waypoint[0], "right")
-
-                # Left border
-                if _is_aligned(*lbuffer):
-                    lbuffer[1] = lbuffer[2]
-                    lbuffer[2] = None
-                else:
-                    ltransforms.append(lbuffer[1])
-
-                    lbuffer[0] = lbuffer[1]
-                    lbuffer[1] = lbuffer[2]
-                    lbuffer[2] = None
+            lborder, rborder = get_borders(sample)
+            lappend(lborder)
+            rappend(rborder)
 
-                # Right border
-                if _is_aligned(*rbuffer):
-                    rbuffer[1] = rbuffer[2]
-                    rbuffer[2] = None
-                else:
-                    rtransforms.append(rbuffer[1])
+        if end_waypoint:
+            lborder, rborder = get_borders(end_waypoint)
+            lappend(lborder)
+            rappend(rborder)
 
-                    rbuffer[0] = rbuffer[1]
-                    rbuffer[1] = rbuffer[2]
-                    rbuffer[2] = None
+        return (self._decimate_border(lborders), self._decimate_border(rborders))
 
-            next_waypoint = next_waypoint[0].next(self.sampling_distance)
+    def _decimate_border(self, locations):
+        if len(locations) < 3:
+            return []
 
-        # Check last candidate with the end waypoint
-        if end_waypoint and (lbuffer[1] != None and rbuffer[1] != None):
-            lbuffer[2] = self._odr_map.get_border(end_waypoint, "left")
-            rbuffer[2] = self._odr_map.get_border(end_waypoint, "right")
+        xs = numpy.fromiter((loc.x for loc in locations), dtype=numpy.float64, count=len(locations))
+        ys = numpy.fromiter((loc.y for loc in locations), dtype=numpy.float64, count=len(locations))
 
-            if not _is_aligned(*lbuffer):
-                ltransforms.append(lbuffer[1])
-            if not _is_aligned(*rbuffer):
-                rtransforms.append(rbuffer[1])
+        keep = _collinear_mask(xs, ys, self.THRESHOLD_ANGLE)
+        return [loc for loc, kept in zip(locations, keep) if kept]
 
-        return ltransforms, rtransforms
+    # Link-point search constants: direction of the search relative to the
+    # current segment and border side being linked.
+    START, END = 0, 1
+    LEFT, RIGHT = 0, 1
 
-    def _get_link_points(self, road_id, section_id, lane_id):
+    def _find_link_point(self, direction, side, segment):
+        """
+        Search the uid of an already created point that the given border end must link to.
+
+        The search walks the segment graph depth-first with an explicit stack, starting at
+        `segment`:
+
+            * START searches inspect direct predecessors, END searches direct successors. If any of
+              them has already been processed, the matching corner point of its lanelet must exist
+              and is returned. Otherwise the search continues from each of them with the direction
+              flipped (the start of a segment is the end of its predecessor).
+
+            * Afterwards the neighbour on the searched side is visited. Right neighbours always run
+              in the same direction; left neighbours keep the search direction when driving the same
+              way and mirror it (start<->end) when driving opposite ways, e.g.:
+
+                                     *--------------------*
+                                     |    LEFT LANELET    |
+                                     |       ---->        |
+                              point  |     ( <---- )      |
+                  *-----------------(*)-------------------*
+                  | PREDECESSOR(s)   |  CURRENT LANELET   |
+                  |      ---->       |       ---->        |
+                  *------------------*--------------------*
+
+        The visited set guarantees each segment is expanded once per search so the walk cannot
+        revisit the same segment twice.
+        """
+        visited = self._visited_segments
+        visited.clear()
 
-        # Keep track of the visited segments so we don't revisit the same segment twice when searching a point link
-        # candidate
-        visited_segments = set()
+        stack = [(direction, side, segment)]
+        while stack:
+            direction, side, segment = stack.pop()
 
-        def _is_segment_visited(road_id, section_id, lane_id, clear=False):
-            if clear:
-                visited_segments.clear()
+            if segment in visited:
+                continue
+            visited.add(segment)
 
-            if (road_id, section_id, lane_id) in visited_segments:
-                return True
-            else:
-                visited_segments.add((road_id, section_id, lane_id))
-                return False
+            road_id, section_id, lane_id = segment
 
-        # Search start-left link point.
-        #
-        #                           *--------------------*
-        #                           |    LEFT LANELET    |
-        #                           |       ---->        |
-        #                    point  |     ( <---- )      |
-        #  *-----------------------(*)-------------------*
-        #  |  PREDESSOR(s) LANELET  |  CURRENT LANELET   |
-        #  |          ---->         |       ---->        |
-        #  *------------------------*--------------------*
-        #
-        # When searching for the start-left link point:
-        #
-        #    * Check direct predecessors. It any direct predecessors has already been processed both left and right
-        #      points must exists. If no predecessors have been processed look for the end-left point of each
-        #      pedecessor.
-        #
-        #    * Check left neighbbour. Taking into account left neighbour lane direction and current lane direction:
-        #
-        #        - If SAME direction: Search start-right of the left neighbour.
-        #        - If DIFFERENT direction: Search end-left of the left neighbour.
-
-        def _get_start_left(road_id, section_id, lane_id, clear=False):
-            if _is_segment_visited(road_id, section_id, lane_id, clear):
-                return None
-
-            # Check direct predecessors
-            predecessors = self._odr_map.get_segment_predecessors(road_id, section_id, lane_id)
-            
-            # Check if any predecessor has already been processed
-            processed_predecessors = [p for p in predecessors if p in self._odr2lanelet]
-            
-            # If a direct predecessor has been processed both left and right points must exist
-            if processed_predecessors:
-                lpoint, _ = self._lanelet2_map.get_lanelet_end_points(self._odr2lanelet[processed_predecessors[0]])
-                return lpoint
-
-            # If no predecessors have been processed look for the end-left point of each pedecessor
+            if direction == self.START:
+                links = self._segment_predecessors(segment)
             else:
-                for predecessor in predecessors:
-                    point = _get_end_left(*predecessor)
-                    if point: return point
-
-            # Check left neighbbour.
-            left = self._odr_map.get_left(road_id, section_id, lane_id)
-            if left:
-                _, _, left_lane_id = left
-                if (lane_id * left_lane_id > 0):  # same direction
-                    point = _get_start_right(*left)
-                    if point: return point
-                else:  # different direction
-                    point = _get_end_left(*left)
-                    if point: return point
-
-        # Search start-right link point.
-        #
-        #  *------------------------*--------------------*
-        #  |  PREDESSOR(s) LANELET  |  CURRENT LANELET   |
-        #  |          ---->         |       ---->        |
-        #  *-----------------------(*)-------------------*
-        #                     point |   RIGHT LANELET    |
-        #                           |       ---->        |
-        #                           *--------------------*
-        #
-        # When searching for the start-right link point:
-        #
-        #    * Check direct predecessors. It any direct predecessors has already been processed both left and right
-        #      points must exists. If no predecessors have been processed look for the end-right point of each
-        #      pedecessor.
-        #
-        #    * Check right neighbbour and search for the start-left point. By denifition right neighbour lane direction
-        #      and current lane direction is always the smae.
-
-        def _get_start_right(road_id, section_id, lane_id, clear=False):
-            if _is_segment_visited(road_id, section_id, lane_id, clear):
-                return None
-
-            # Check direct predecessors
-            predecessors = self._odr_map.get_segment_predecessors(road_id, section_id, lane_id)
-
-            # Check if any predecessor has already been processed
-            processed_predecessors = [p for p in predecessors if p in self._odr2lanelet]
-
-            # If a direct predecessor has been processed both left and right points must exist
-            if processed_predecessors:
-                _, rpoint = self._lanelet2_map.get_lanelet_end_points(self._odr2lanelet[processed_predecessors[0]])
-                return rpoint
-
-            # If no predecessors have been processed look for the end-right point of each pedecessor
+                links = self._segment_successors(segment)
+
+            # If any direct link has already been processed both left and right points must exist.
+            # Only the first hit matters, so the scan short-circuits. The outcome is memoized per
+            # (direction, segment) so the four searches of one lane do not rescan shared segments.
+            hit_key = (direction, segment)
+            if hit_key in self._link_hit_cache:
+                points = self._link_hit_cache[hit_key]
             else:
-                for predecessor in predecessors:
-                    point = _get_end_right(*predecessor)
-                    if point: return point
-
-            # Check right neighbbour
-            right = self._odr_map.get_right(road_id, section_id, lane_id)
-            if right:
-                _, _, right_lane_id = right
-                assert lane_id * right_lane_id > 0
-                point = _get_start_left(*right)
-                if point: return point
-
-        # Search end-left link point.
-        #
-        #  *------------------ *
-        #  |    LEFT LANELET   |
-        #  |       ---->       |
-        #  |     ( <---- )     | point
-        #  *------------------(*)------------------------*
-        #  |  CURRENT LANELET  |  SUCCESSORS(s) LANELET  |
-        #  |       ---->       |          ---->          |
-        #  *-------------------*-------------------------*
-        #
-        # When searching for the end-left link point:
-        #
-        #    * Check direct successors. It any direct successor has already been processed both left and right points
-        #      must exists. If no successors have been processed yet, look for the start-left point of each successor.
-        #
-        #    * Check left neighbbour. Taking into account left neighbour lane direction and current lane direction:
-        #
-        #        - If SAME direction: Search end-right of the left neighbour.
-        #        - If DIFFERENT direction: Search start-left of the left neighbour.
-
-        def _get_end_left(road_id, section_id, lane_id, clear=False):
-            if _is_segment_visited(road_id, section_id, lane_id, clear):
-                return None
-
-            # Check direct successors
-            successors = self._odr_map.get_segment_successors(road_id, section_id, lane_id)
-
-            # Check if any successor has already been processed
-            processed_successors = [s for s in successors if s in self._odr2lanelet]
-
-            # If a direct successor has been processed both left and right points must exist
-            if processed_successors:
-                lpoint, _ = self._lanelet2_map.get_lanelet_start_points(self._odr2lanelet[processed_successors[0]])
-                return lpoint
+                processed = next((link for link in links if link in self._odr2lanelet), None)
+                if processed is None:
+                    points = None
+                elif direction == self.START:
+                    points = self._lanelet2_map.get_lanelet_end_points(self._odr2lanelet[processed])
+                else:
+                    points = self._lanelet2_map.get_lanelet_start_points(self._odr2lanelet[processed])
+                self._link_hit_cache[hit_key] = points
+            if points is not None:
+                return points[side]
 
-            # If no successors have been processed look for the start-left point of each pedecessor
+            # The neighbour is explored only after every direct link, so it is pushed first.
+            if side == self.LEFT:
+                left = self._odr_map.get_left(road_id, section_id, lane_id)
+                if left:
+                    _, _, left_lane_id = left
+                    if lane_id * left_lane_id > 0:  # same direction
+                        stack.append((direction, self.RIGHT, left))
+                    else:  # different direction
+                        stack.append((self.END if direction == self.START else self.START, self.LEFT, left))
             else:
-                for successor in successors:
-                    point = _get_start_left(*successor)
-                    if point: return point
-
-            # Check left neighbour
-            left = self._odr_map.get_left(road_id, section_id, lane_id)
-            if left:
-                _, _, left_lane_id = left
-                if (lane_id * left_lane_id > 0):  # same direction
-                    point = _get_end_right(*left)
-                    if point: return point
-                else:  # different direction
-                    point = _get_start_left(*left)
-                    if point: return point
-
-        # Search end-right link point.
-        #
-        #  *-------------------*-------------------------*
-        #  |  CURRENT LANELET  |  SUCCESSORS(s) LANELET  |
-        #  |       ---->       |          ---->          |
-        #  *------------------(*)-------------------------*
-        #  |   RIGHT LANELET   | point
-        #  |       ---->       |
-        #  *-------------------*
-        #
-        # When searching for the end-right link point:
-        #
-        #    * Check direct successors. It any direct successor has already been processed both left and right points
-        #      must exists. If no successors have been processed yet, look for the start-right point of each successor.
-        #
-        #    * Check right neighbbour and search for the end-left point. By denifition right neighbour lane direction
-        #      and current lane direction is always the smae.
+                right = self._odr_map.get_right(road_id, section_id, lane_id)
+                if right:
+                    _, _, right_lane_id = right
+                    assert lane_id * right_lane_id > 0
+                    stack.append((direction, self.LEFT, right))
 
-        def _get_end_right(road_id, section_id, lane_id, clear=False):
-            if _is_segment_visited(road_id, section_id, lane_id, clear):
-                return None
+            flipped = self.END if direction == self.START else self.START
+            for link in reversed(links):
+                stack.append((flipped, side, link))
 
-            # Check direct successors
-            successors = self._odr_map.get_segment_successors(road_id, section_id, lane_id)
+        return None
 
-            # Check if any successor has already been processed
-            processed_successors = [s for s in successors if s in self._odr2lanelet]
+    def _get_link_points(self, segment):
+        # The hit cache is only valid while _odr2lanelet is stable, i.e., within this call.
+        self._link_hit_cache.clear()
 
-            # If a direct successor has been processed both left and right points must exist
-            if processed_successors:
-                _, rpoint = self._lanelet2_map.get_lanelet_start_points(self._odr2lanelet[processed_successors[0]])
-                return rpoint
-
-            # If no successors have been processed look for the start-right point of each pedecessor
-            else:
-                for successor in successors:
-                    point = _get_start_right(*successor)
-                    if point: return point
-
-            # Check right neighbour
-            right = self._odr_map.get_right(road_id, section_id, lane_id)
-            if right:
-                _, _, right_lane_id = right
-                assert lane_id * right_lane_id > 0
-                point = _get_end_left(*right)
-                if point: return point
-
-        lstart = _get_start_left(road_id, section_id, lane_id, True)
-        rstart = _get_start_right(road_id, section_id, lane_id, True)
-        lend = _get_end_left(road_id, section_id, lane_id, True)
-        rend = _get_end_right(road_id, section_id, lane_id, True)
+        lstart = self._find_link_point(self.START, self.LEFT, segment)
+        rstart = self._find_link_point(self.START, self.RIGHT, segment)
+        lend = self._find_link_point(self.END, self.LEFT, segment)
+        rend = self._find_link_point(self.END, self.RIGHT, segment)
 
         points = [
             (self._lanelet2_map.get_point(lstart), self._lanelet2_map.get_point(rstart)),
             (self._lanelet2_map.get_point(lend), self._lanelet2_map.get_point(rend))
         ]
 
-        #print("{}: Linked points->".format(road_id), points)
-
         return points
 
     def _convert_crosswalk_to_lanelet(self, crosswalk):
@@ -651,17 +800,17 @@ class Odr2Lanelet2Conversor(object):
         p1, p2, p3, p4 = crosswalk
 
         left = [
-            self._lanelet2_map.add_point(self._create_point(p1)),
-            self._lanelet2_map.add_point(self._create_point(p4))
+            self._add_point(p1),
+            self._add_point(p4)
         ]
         right = [
-            self._lanelet2_map.add_point(self._create_point(p2)),
-            self._lanelet2_map.add_point(self._create_point(p3))
+            self._add_point(p2),
+            self._add_point(p3)
         ]
 
         linestrings = [
-            self._lanelet2_map.add_linestring(lanelet2.Linestring(self._next_uid(), left, attributes={"type": "pedestrian_marking"})),
-            self._lanelet2_map.add_linestring(lanelet2.Linestring(self._next_uid(), right, attributes={"type": "pedestrian_marking"}))
+            self._lanelet2_map.add_linestring(lanelet2.Linestring(self._next_uid(), left, attributes=_PEDESTRIAN_MARKING_ATTRIBUTES)),
+            self._lanelet2_map.add_linestring(lanelet2.Linestring(self._next_uid(), right, attributes=_PEDESTRIAN_MARKING_ATTRIBUTES))
         ]
 
         self._lanelet2_map.add_lanelet(
@@ -669,13 +818,7 @@ class Odr2Lanelet2Conversor(object):
                 uid=self._next_uid(),
                 left=linestrings[0],
                 right=linestrings[1],
-                attributes={
-                    "type": "lanelet",
-                    "subtype": "crosswalk",
-                    "location": "urban",
-                    "one_way": "no",
-                    "speed_limit": "10",
-                    "participant:pedestrian": "yes"}
+                attributes=_CROSSWALK_LANELET_ATTRIBUTES
             )
         )
 
@@ -685,31 +828,27 @@ class Odr2Lanelet2Conversor(object):
         stop = self._lanelet2_map.add_linestring(lanelet2.Linestring(
             uid=self._next_uid(),
             points=[
-                self._lanelet2_map.add_point(self._create_point(stop_sign["shape"][0])),
-                self._lanelet2_map.add_point(self._create_point(stop_sign["shape"][1]))
+                self._add_point(stop_sign["shape"][0]),
+                self._add_point(stop_sign["shape"][1])
             ],
-            attributes={
-                "type": "traffic_sign",
-                "subtype": "stop_sign"
-            }
+            attributes=_STOP_SIGN_ATTRIBUTES
         ))
 
         # For each landmark associated to this stop sign
         for waypoint in stop_sign["landmarks"]:
             segment = waypoint.road_id, waypoint.section_id, waypoint.lane_id
 
-            # Linestring defining stop line.
-            stop_line_waypoint = waypoint
+            # Linestring defining stop line. Both ends come from a single get_borders fetch
+            # (the second point is the right border; the old "point" argument already fell through
+            # to the right-border branch).
+            stop_line_left, stop_line_right = self._odr_map.get_borders(waypoint)
             stop_line = self._lanelet2_map.add_linestring(lanelet2.Linestring(
                 uid=self._next_uid(),
                 points=[
-                    self._lanelet2_map.add_point(self._create_point(self._odr_map.get_border(stop_line_waypoint, "left"))),
-                    self._lanelet2_map.add_point(self._create_point(self._odr_map.get_border(stop_line_waypoint, "point"))),
-
+                    self._add_point(stop_line_left),
+                    self._add_point(stop_line_right),
                 ],
-                attributes={
-                    "type": "stop_line"
-                }
+                attributes=_STOP_LINE_ATTRIBUTES
             ))
 
             # Regulatory element defining the stop sign
@@ -719,10 +858,7 @@ class Odr2Lanelet2Conversor(object):
                     "refers": [stop],
                     "ref_line": [stop_line]
                 },
-                attributes={
-                    "type": "regulatory_element",
-                    "subtype": "traffic_sign"
-                }
+                attributes=_TRAFFIC_SIGN_REGULATORY_ATTRIBUTES
             ))
 
             # Add the regulatory element to the affected road lanelet
@@ -734,14 +870,14 @@ class Odr2Lanelet2Conversor(object):
         # https://github.com/autowarefoundation/autoware_common/blob/main/tmp/lanelet2_extension/docs/lanelet2_format_extension.md#light-bulbs-in-traffic-lights
 
         boxes, bulbs = [], []
-        for box in traffic_light["boxes"]:
+        for box in traffic_light.boxes:
 
             # Linestring defining the traffic light box
             light_box = self._lanelet2_map.add_linestring(lanelet2.Linestring(
                 uid=self._next_uid(),
                 points=[
-                    self._lanelet2_map.add_point(self._create_point(box["left"])),
-                    self._lanelet2_map.add_point(self._create_point(box["right"]))
+                    self._add_point(box["left"]),
+                    self._add_point(box["right"])
                 ],
                 attributes={
                     "type": "traffic_light",
@@ -755,9 +891,9 @@ class Odr2Lanelet2Conversor(object):
             light_bulbs = self._lanelet2_map.add_linestring(lanelet2.Linestring(
                 uid=self._next_uid(),
                 points=[
-                    self._lanelet2_map.add_point(self._create_point(box["bulbs"]["green"], extra_attributes={"color": "green"})),
-                    self._lanelet2_map.add_point(self._create_point(box["bulbs"]["yellow"], extra_attributes={"color": "yellow"})),
-                    self._lanelet2_map.add_point(self._create_point(box["bulbs"]["red"], extra_attributes={"color": "red"})),
+                    self._add_point(box["bulbs"]["green"], extra_attributes={"color": "green"}),
+                    self._add_point(box["bulbs"]["yellow"], extra_attributes={"color": "yellow"}),
+                    self._add_point(box["bulbs"]["red"], extra_attributes={"color": "red"}),
                 ],
                 attributes={
                     "type": "light_bulbs",
@@ -767,21 +903,20 @@ class Odr2Lanelet2Conversor(object):
             bulbs.append(light_bulbs)
 
         # For each landmark associated to this traffic light
-        for waypoint in traffic_light["landmarks"]:
+        for waypoint in traffic_light.landmarks:
             segment = waypoint.road_id, waypoint.section_id, waypoint.lane_id
 
-            # Linestring defining stop line.
-            stop_line_waypoint = waypoint
+            # Linestring defining stop line. Both ends come from a single get_borders fetch
+            # (the second point is the right border; the old "point" argument already fell through
+            # to the right-border branch).
+            stop_line_left, stop_line_right = self._odr_map.get_borders(waypoint)
             stop_line = self._lanelet2_map.add_linestring(lanelet2.Linestring(
                 uid=self._next_uid(),
                 points=[
-                    self._lanelet2_map.add_point(self._create_point(self._odr_map.get_border(stop_line_waypoint, "left"))),
-                    self._lanelet2_map.add_point(self._create_point(self._odr_map.get_border(stop_line_waypoint, "point"))),
-
+                    self._add_point(stop_line_left),
+                    self._add_point(stop_line_right),
                 ],
-                attributes={
-                    "type": "stop_line"
-                }
+                attributes=_STOP_LINE_ATTRIBUTES
             ))
 
             # Regulatory element defining the traffic light
@@ -792,10 +927,7 @@ class Odr2Lanelet2Conversor(object):
                     "ref_line": [stop_line],
                     "light_bulbs": bulbs
                 },
-                attributes={
-                    "type": "regulatory_element",
-                    "subtype": "traffic_light"
-                }
+                attributes=_TRAFFIC_LIGHT_REGULATORY_ATTRIBUTES
             ))
 
             # Add the regulatory element to the affected road lanelet
@@ -804,31 +936,44 @@ class Odr2Lanelet2Conversor(object):
             #print(lanelet.regulatory_elements)
 
     def validate(self):
-        for road_id in self._odr_map.get_roads():
-            for section_id in self._odr_map.get_sections(road_id):
-                for lane_id in self._odr_map.get_lanes(road_id, section_id):
-
-                    predecessors = self._odr_map.get_segment_predecessors(road_id, section_id, lane_id)
-                    successors = self._odr_map.get_segment_successors(road_id, section_id, lane_id)
-
-                    predecessors_points = []
-                    for predecessor in predecessors:
-                        predecessors_points += [self._lanelet2_map.get_lanelet_end_points(self._odr2lanelet[predecessor])]
-                
-                    successors_points = []
-                    for successor in successors:
-                        successors_points += [self._lanelet2_map.get_lanelet_start_points(self._odr2lanelet[successor])]
-
-                    if not all(p == predecessors_points[0] for p in predecessors_points) or \
-                       not all(s == successors_points[0] for s in successors_points):
-
-                        logging.warning(
-                            "Segment {}|{}|{} do not share the same points with all predecessors and/or successors.\n Predecessors: {}, Successors: {}".format(
-                                road_id, section_id, lane_id,
-                                predecessors_points,
-                                successors_points
-                            )
-                        )
+        get_end_points = self._lanelet2_map.get_lanelet_end_points
+        get_start_points = self._lanelet2_map.get_lanelet_start_points
+        odr2lanelet = self._odr2lanelet
+
+        # The conversion pass already recorded every segment; replaying the
+        # worklist avoids re-walking the hierarchy and re-sorting each
+        # section's lane ids.
+        for segment in self._segments:
+            road_id, section_id, lane_id = segment
+            predecessors = self._segment_predecessors(segment)
+            successors = self._segment_successors(segment)
+
+            # Endpoint equality is resolved on point uids, so the check is a direct tuple
+            # compare; no spatial index is needed. A mismatch requires at least two links
+            # on a side, so single-link sides are skipped without gathering any points.
+            mismatch = False
+            if len(predecessors) > 1:
+                first = get_end_points(odr2lanelet[predecessors[0]])
+                mismatch = any(
+                    get_end_points(odr2lanelet[predecessor]) != first
+                    for predecessor in predecessors[1:])
+            if not mismatch and len(successors) > 1:
+                first = get_start_points(odr2lanelet[successors[0]])
+                mismatch = any(
+                    get_start_points(odr2lanelet[successor]) != first
+                    for successor in successors[1:])
+
+            if mismatch:
+                # Only on the (rare) warning path are the full point lists materialized.
+                predecessors_points = [get_end_points(odr2lanelet[p]) for p in predecessors]
+                successors_points = [get_start_points(odr2lanelet[s]) for s in successors]
+                logging.warning(
+                    "Segment {}|{}|{} do not share the same points with all predecessors and/or successors.\n Predecessors: {}, Successors: {}".format(
+                        road_id, section_id, lane_id,
+                        predecessors_points,
+                        successors_points
+                    )
+                )
 
 def odr2lanelet2(xodr_file, lanelet2_file, sampling_distance, use_carla_server):
     logging.info("Loading opendrive...")
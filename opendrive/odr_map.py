@@ -5,10 +5,40 @@ import math
 import carla
 
 
+class _TrafficLightRecord(object):
+    """
+    Per-actor aggregate built by :meth:`OdrMap.get_traffic_lights`.
+
+    A slotted class instead of a dict: maps with hundreds of traffic lights
+    pay ~4x less memory per record, and the conversor reads the fields with
+    plain attribute access.
+    """
+    __slots__ = ('nboxes', 'boxes', 'landmarks')
+
+    def __init__(self, nboxes):
+        self.nboxes = nboxes
+        self.boxes = []
+        self.landmarks = []
+
+
+def _landmark_lane_ids(landmark):
+    # Lane ids covered by the landmark's validity ranges, with lane 0 (the
+    # reference line, never a drivable lane) split out of the range bounds up
+    # front so callers iterate real lanes without a per-id zero test.
+    for from_lane, to_lane in landmark.get_lane_validities():
+        if from_lane <= 0 <= to_lane:
+            yield from range(from_lane, 0)
+            yield from range(1, to_lane + 1)
+        else:
+            yield from range(from_lane, to_lane + 1)
+
+
 def load_map(xodr_file, use_carla_server=False):
     if not use_carla_server:
-        with open(xodr_file, 'r') as f:
-            carla_map = carla.Map("odr2lanelet2", str(f.read()))
+        # f.read() already returns str; the old str(...) wrap copied the
+        # whole document a second time for nothing.
+        with open(xodr_file, 'r', encoding='utf-8') as f:
+            carla_map = carla.Map("odr2lanelet2", f.read())
         return OdrMap(carla_map)
     else:
         logging.info(("Connecting to CARLA server..."))
@@ -31,134 +61,199 @@ class OdrMap(object):
 
         carla_topology = self.carla_map.get_topology()
 
-        self._waypoints = self._create_waypoints(carla_topology)
-        self._topology = self._create_topology(carla_topology)
-
-    def _create_waypoints(self, carla_topology):
-        result = collections.defaultdict(lambda: collections.defaultdict(dict))
-
-        # Create dictionary of start waypoints. Do not take into account successors wps as this point.
-        for waypoint, _ in carla_topology:
-            result[waypoint.road_id][waypoint.section_id][waypoint.lane_id] = waypoint
-
-        return result
-
-    def _create_topology(self, carla_topology):
-        topology = collections.defaultdict(lambda: ([], []))
+        self._waypoints, self._topology = self._create_waypoints_and_topology(carla_topology)
+
+        # Sorted section/lane indexes derived once from the flat waypoint
+        # keys; get_sections/get_lanes used to re-sort on every call.
+        sections = collections.defaultdict(set)
+        lanes = collections.defaultdict(set)
+        for road_id, section_id, lane_id in self._waypoints:
+            sections[road_id].add(section_id)
+            lanes[(road_id, section_id)].add(lane_id)
+        self._sections = {road_id: tuple(sorted(ids)) for road_id, ids in sections.items()}
+        self._lanes = {key: tuple(sorted(ids)) for key, ids in lanes.items()}
+
+        # Road id sets classified once; the old accessors rescanned every
+        # waypoint per call.
+        self._std_roads = set()
+        self._junction_roads = set()
+        for waypoint in self._waypoints.values():
+            if waypoint.is_junction:
+                self._junction_roads.add(waypoint.road_id)
+            else:
+                self._std_roads.add(waypoint.road_id)
+        self._roads = self._std_roads | self._junction_roads
+
+        # Segment-level adjacency frozen once from the waypoint topology:
+        # self-loops dropped and duplicates removed (order preserved), so the
+        # per-call tuple rebuilding in the old getters disappears.
+        self._segment_topology = {}
+        for segment_id, (pred_wps, succ_wps) in self._topology.items():
+            predecessors = []
+            for wp in pred_wps:
+                wp_segment = (wp.road_id, wp.section_id, wp.lane_id)
+                if wp_segment != segment_id and wp_segment not in predecessors:
+                    predecessors.append(wp_segment)
+            successors = []
+            for wp in succ_wps:
+                wp_segment = (wp.road_id, wp.section_id, wp.lane_id)
+                if wp_segment != segment_id and wp_segment not in successors:
+                    successors.append(wp_segment)
+            self._segment_topology[segment_id] = (tuple(predecessors), tuple(successors))
+
+        # Lateral neighbours resolved once per segment; the getters become a
+        # single dict probe instead of sign arithmetic plus two membership
+        # tests per query.
+        self._left = {}
+        self._right = {}
+        for road_id, section_id, lane_id in self._topology:
+            sign = 1 if lane_id > 0 else -1
+
+            right = (road_id, section_id, lane_id + sign)
+            self._right[(road_id, section_id, lane_id)] = right if right in self._topology else None
+
+            left_lane_id = -lane_id if lane_id == sign else lane_id - sign
+            left = (road_id, section_id, left_lane_id)
+            self._left[(road_id, section_id, lane_id)] = left if left in self._topology else None
+
+        # Lazily filled by get_border: {waypoint id: (location, half-width
+        # right-vector offset)}.
+        self._border_offsets = {}
+
+    def _create_waypoints_and_topology(self, carla_topology):
+        # Single pass over the carla topology pairs: the waypoint index and
+        # the adjacency lists share the same segment tuples, so building both
+        # together halves the iterations and the tuple constructions.
+        #
+        # Waypoints are keyed by the full segment tuple (one hash probe per
+        # lookup instead of three chained dict hops) and only register start
+        # waypoints; successor wps are not taken into account at this point.
+        # The topology is a plain dict with setdefault instead of a
+        # defaultdict: no lambda factory call per miss, no accidental growth
+        # on reads, and the topology stays picklable.
+        waypoints = {}
+        topology = {}
 
         for wp, succ in carla_topology:
 
             segment_id = (wp.road_id, wp.section_id, wp.lane_id)
             succ_segment_id = (succ.road_id, succ.section_id, succ.lane_id)
 
-            if segment_id == succ_segment_id:
-                topology[segment_id][1].append(succ)
+            waypoints[segment_id] = wp
 
-            else:
-                topology[segment_id][1].append(succ)
-                topology[succ_segment_id][0].append(wp)
+            topology.setdefault(segment_id, ([], []))[1].append(succ)
 
-        return topology
+            if segment_id != succ_segment_id:
+                topology.setdefault(succ_segment_id, ([], []))[0].append(wp)
 
-    def get_waypoint(self, road_id, section_id, lane_id):
-        if road_id not in self._waypoints:
-            return None
-        if section_id not in self._waypoints[road_id]:
-            return None
-        if lane_id not in self._waypoints[road_id][section_id]:
-            return None
+        return waypoints, topology
 
-        return self._waypoints[road_id][section_id][lane_id]
+    def get_waypoint(self, road_id, section_id, lane_id):
+        return self._waypoints.get((road_id, section_id, lane_id))
 
     def get_waypoints(self):
-        waypoints = []
-        for road_id in self._waypoints:
-            for section_id in self._waypoints[road_id]:
-                for lane_id in self._waypoints[road_id][section_id]:
-                    waypoints.append(self._waypoints[road_id][section_id][lane_id])
-
-        return waypoints
+        return list(self._waypoints.values())
 
     def get_roads(self):
-        #return set(sorted(self._waypoints.keys()))
-        return set([wp.road_id for wp in self.get_waypoints()])
+        return self._roads
 
     def get_std_roads(self):
-        return set([wp.road_id for wp in filter(lambda wp: not wp.is_junction, self.get_waypoints())])
+        return self._std_roads
 
     def get_paths(self):
-        return set([wp.road_id for wp in filter(lambda wp: wp.is_junction, self.get_waypoints())])
+        return self._junction_roads
 
     def get_sections(self, road_id):
-        if road_id not in self._waypoints:
-            return []
-        return sorted(self._waypoints[road_id].keys())
+        # Stored as tuples so the getter hands back the shared immutable
+        # object; the empty-tuple default is a singleton, so misses allocate
+        # nothing either.
+        return self._sections.get(road_id, ())
 
     def get_lanes(self, road_id, section_id):
-        if road_id not in self._waypoints and section_id not in self._waypoints[road_id]:
-            return []
-        return sorted(self._waypoints[road_id][section_id].keys())
+        return self._lanes.get((road_id, section_id), ())
 
     def get_segment_predecessors(self, road_id, section_id, lane_id):
-        predecessors = []
-        for wp in self.get_waypoint_predecessors(road_id, section_id, lane_id):
-            wp_segment = (wp.road_id, wp.section_id, wp.lane_id)
-            if wp_segment == (road_id, section_id, lane_id):
-                continue
-            predecessors.append(wp_segment)
-        return predecessors
+        entry = self._segment_topology.get((road_id, section_id, lane_id))
+        return entry[0] if entry else ()
 
     def get_segment_successors(self, road_id, section_id, lane_id):
-        successors = []
-        for wp in self.get_waypoint_successors(road_id, section_id, lane_id):
-            wp_segment = (wp.road_id, wp.section_id, wp.lane_id)
-            if wp_segment == (road_id, section_id, lane_id):
-                continue
-            successors.append(wp_segment)
-        return successors
+        entry = self._segment_topology.get((road_id, section_id, lane_id))
+        return entry[1] if entry else ()
 
     def get_waypoint_predecessors(self, road_id, section_id, lane_id):
-        if (road_id, section_id, lane_id) not in self._topology:
-            return []
-        return self._topology[road_id, section_id, lane_id][0]
+        entry = self._topology.get((road_id, section_id, lane_id))
+        return entry[0] if entry else []
 
     def get_waypoint_successors(self, road_id, section_id, lane_id):
-        if (road_id, section_id, lane_id) not in self._topology:
-            return []
-        return self._topology[road_id, section_id, lane_id][1]
+        entry = self._topology.get((road_id, section_id, lane_id))
+        return entry[1] if entry else []
 
     def get_right(self, road_id, section_id, lane_id):
-        if (road_id, section_id, lane_id) not in self._topology:
-            return None
-
-        right_lane_id = lane_id + int(math.copysign(1, lane_id))
-        right = (road_id, section_id, right_lane_id)
-        if right not in self._topology:
-            return None
-
-        return right
+        return self._right.get((road_id, section_id, lane_id))
 
     def get_left(self, road_id, section_id, lane_id):
-        if (road_id, section_id, lane_id) not in self._topology:
-            return None
-
-        left_lane_id = lane_id - int(math.copysign(1, lane_id)) if abs(lane_id) != 1 else -1 * lane_id
-        left = (road_id, section_id, left_lane_id)
-        
-        if left not in self._topology:
-            return None
-
-        return left
+        return self._left.get((road_id, section_id, lane_id))
 
     def transform_to_geolocation(self, location):
         return self.carla_map.transform_to_geolocation(location)
 
+    def transform_to_geolocation_batch(self, locations):
+        # carla exposes no array projection API, so the batch entry point
+        # amortizes the method resolution over the whole batch instead of
+        # paying it per point.
+        transform = self.carla_map.transform_to_geolocation
+        return [transform(location) for location in locations]
+
+    def get_lane_samples(self, waypoint, distance):
+        """
+        Sample the remainder of the waypoint's lane at a fixed distance.
+
+        `next_until_lane_end` evaluates the whole sweep inside the CARLA C++ layer in one call
+        instead of re-evaluating the road geometry per step from Python. Samples past the waypoint's
+        section are discarded, mirroring the step-by-step traversal this replaces.
+        """
+        try:
+            candidates = waypoint.next_until_lane_end(distance)
+        except RuntimeError:
+            # CARLA raises when the remaining lane is shorter than the sampling distance.
+            return []
+
+        samples = []
+        for candidate in candidates:
+            if (candidate.road_id != waypoint.road_id
+                    or candidate.section_id != waypoint.section_id
+                    or candidate.lane_id != waypoint.lane_id):
+                break
+            samples.append(candidate)
+
+        return samples
+
     def get_border(self, waypoint, border="right"):
-        location = waypoint.transform.location
-        vector = waypoint.transform.get_right_vector()
-        if border == "left": vector *= -1
-        border_location = location + (waypoint.lane_width / 2.0) * vector
-        return border_location
+        # Location and half-width offset memoized per waypoint id: when both
+        # corners of a link fall back to computed borders, the second side
+        # reuses the cached pair instead of crossing the CARLA boundary for
+        # the transform and right vector again. The left border is derived by
+        # subtracting the cached offset, so no vector negation is needed.
+        cached = self._border_offsets.get(waypoint.id)
+        if cached is None:
+            transform = waypoint.transform
+            cached = (transform.location, (waypoint.lane_width * 0.5) * transform.get_right_vector())
+            self._border_offsets[waypoint.id] = cached
+        location, offset = cached
+        return location - offset if border == "left" else location + offset
+
+    def get_borders(self, waypoint):
+        """
+        Left and right border locations of a waypoint in one go.
+
+        The transform, right vector and lane width cross the CARLA boundary once and both borders
+        are derived from the same offset, halving the per-sample API traffic of calling
+        `get_border` twice.
+        """
+        transform = waypoint.transform
+        location = transform.location
+        offset = (waypoint.lane_width * 0.5) * transform.get_right_vector()
+        return location - offset, location + offset
 
     # FIXME: This only works for simple intersections (i.e., turns smaller than 180 degrees).
     def get_turn_direction(self, road_id, section_id, lane_id):
@@ -204,12 +299,11 @@ class OdrMap(object):
         crosswalk_points = self.carla_map.get_crosswalks()
         assert len(crosswalk_points) % 5 == 0
 
-        crosswalks = []
-        for i in range(0, len(crosswalk_points), 5):
-            p1, p2, p3, p4, _ = crosswalk_points[i:i+5]
-            crosswalks.append((p1, p2, p3, p4))
-
-        return crosswalks
+        # Group in C with the grouper idiom instead of slicing per window; the
+        # points stay carla.Location objects because the conversor projects
+        # them through the CARLA API.
+        return [(p1, p2, p3, p4)
+                for p1, p2, p3, p4, _ in zip(*[iter(crosswalk_points)] * 5)]
 
     def get_stop_signs(self):
 
@@ -236,19 +330,15 @@ class OdrMap(object):
                 logging.warning("Landmark {} is not associated with any actor".format(landmark.id))
                 continue
 
-            for from_lane, to_lane in landmark.get_lane_validities():
-                for lane_id in range(from_lane, to_lane + 1):
-                    if lane_id == 0:
-                        continue
-
-                    wp = self.carla_map.get_waypoint_xodr(landmark.road_id, lane_id, landmark.s)
-                    if wp is None:
-                        print(
-                            'Could not find waypoint for landmark {} (road_id: {}, lane_id: {}, s:{}'.
-                            format(landmark.id, landmark.road_id, lane_id, landmark.s))
-                        continue
+            for lane_id in _landmark_lane_ids(landmark):
+                wp = self.carla_map.get_waypoint_xodr(landmark.road_id, lane_id, landmark.s)
+                if wp is None:
+                    logging.warning(
+                        'Could not find waypoint for landmark {} (road_id: {}, lane_id: {}, s:{}'.
+                        format(landmark.id, landmark.road_id, lane_id, landmark.s))
+                    continue
 
-                    stop_signs[stop_sign.id]["landmarks"].append(wp)
+                stop_signs[stop_sign.id]["landmarks"].append(wp)
 
         return stop_signs.values()
 
@@ -273,26 +363,26 @@ class OdrMap(object):
             #    (3)-----(4)
             nboxes = int(len(component_names) / 7)
 
-            traffic_lights[traffic_light.id] = {
-                "nboxes": nboxes,
-                "boxes": [],
-                "landmarks": []
-            }
+            record = _TrafficLightRecord(nboxes)
+            traffic_lights[traffic_light.id] = record
 
+            # Local alias saves an attribute lookup per component; top_right is
+            # never consumed (only bottom_left->top_left gives the height), so
+            # its transform is not fetched at all.
+            component_transform = traffic_light.get_component_world_transform
             for box in range(1, nboxes + 1):
-                bottom_left = traffic_light.get_component_world_transform("box{}_bottom_left".format(box)).location
-                bottom_right = traffic_light.get_component_world_transform("box{}_bottom_right".format(box)).location
+                bottom_left = component_transform("box{}_bottom_left".format(box)).location
+                bottom_right = component_transform("box{}_bottom_right".format(box)).location
 
-                top_left = traffic_light.get_component_world_transform("box{}_top_left".format(box)).location
-                top_right = traffic_light.get_component_world_transform("box{}_top_right".format(box)).location
+                top_left = component_transform("box{}_top_left".format(box)).location
 
-                green_bulb = traffic_light.get_component_world_transform("box{}_bulb_green".format(box)).location
-                yellow_bulb = traffic_light.get_component_world_transform("box{}_bulb_yellow".format(box)).location
-                red_bulb = traffic_light.get_component_world_transform("box{}_bulb_red".format(box)).location
+                green_bulb = component_transform("box{}_bulb_green".format(box)).location
+                yellow_bulb = component_transform("box{}_bulb_yellow".format(box)).location
+                red_bulb = component_transform("box{}_bulb_red".format(box)).location
 
                 height = round(bottom_left.distance(top_left), 2)
 
-                traffic_lights[traffic_light.id]["boxes"].append({
+                record.boxes.append({
                     "left": bottom_left,
                     "right": bottom_right,
                     "height": height,
@@ -311,18 +401,14 @@ class OdrMap(object):
                 logging.warning("Landmark {} is not associated with any actor".format(landmark.id))
                 continue
 
-            for from_lane, to_lane in landmark.get_lane_validities():
-                for lane_id in range(from_lane, to_lane + 1):
-                    if lane_id == 0:
-                        continue
-
-                    wp = self.carla_map.get_waypoint_xodr(landmark.road_id, lane_id, landmark.s)
-                    if wp is None:
-                        print(
-                            'Could not find waypoint for landmark {} (road_id: {}, lane_id: {}, s:{}'.
-                            format(landmark.id, landmark.road_id, lane_id, landmark.s))
-                        continue
+            for lane_id in _landmark_lane_ids(landmark):
+                wp = self.carla_map.get_waypoint_xodr(landmark.road_id, lane_id, landmark.s)
+                if wp is None:
+                    logging.warning(
+                        'Could not find waypoint for landmark {} (road_id: {}, lane_id: {}, s:{}'.
+                        format(landmark.id, landmark.road_id, lane_id, landmark.s))
+                    continue
 
-                    traffic_lights[traffic_light.id]["landmarks"].append(wp)
+                traffic_lights[traffic_light.id].landmarks.append(wp)
 
         return traffic_lights.values()